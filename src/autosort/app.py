@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from pathlib import Path
 from typing import Any, Dict
 
@@ -34,6 +35,7 @@ class AutoSortApp(App):
         Binding("r", "resort", "Re-sort"),
         Binding("b", "browse", "Browse"),
         Binding("w", "watch_toggle", "Watch"),
+        Binding("s", "stop_sort", "Stop"),
         Binding("u", "undo_last", "Undo"),
         Binding("c", "show_config", "Config"),
         Binding("q", "quit", "Quit"),
@@ -60,7 +62,7 @@ class AutoSortApp(App):
                 yield Button("Watch", id="btn-watch", variant="success")
                 yield Button("Undo", id="btn-undo", variant="warning")
                 yield Button("Config", id="btn-config")
-            yield RichLog(id="log-panel", highlight=True, markup=True)
+            yield RichLog(id="log-panel", highlight=True, markup=True, max_lines=5000)
         yield Footer()
 
     def on_mount(self) -> None:
@@ -128,6 +130,10 @@ class AutoSortApp(App):
         else:
             self._start_watching()
 
+    def action_stop_sort(self) -> None:
+        self.fo.request_cancel()
+        self._log("[yellow]Stopping after the current file...[/yellow]")
+
     def action_undo_last(self) -> None:
         info = self.um.get_undo_info()
         if not info["can_undo"]:
@@ -162,6 +168,25 @@ class AutoSortApp(App):
                 if len(rules) > 8:
                     log.write(f"      [dim]... +{len(rules) - 8} more[/dim]")
 
+    def _make_progress_callback(self, log: RichLog):
+        """Progress callback that throttles log writes to ~30/sec.
+
+        One call_from_thread per file floods the UI event loop on large
+        directories; rate-limiting keeps the log readable and the worker
+        unblocked. The final file is always written.
+        """
+        last = 0.0
+
+        def cb(current, total, name):
+            nonlocal last
+            now = time.monotonic()
+            if current < total and now - last < 0.033:
+                return
+            last = now
+            self.call_from_thread(log.write, f"  [{current}/{total}] {name}")
+
+        return cb
+
     @work(thread=True)
     def _run_sort(self, source: Path) -> None:
         log = self.query_one("#log-panel", RichLog)
@@ -175,12 +200,7 @@ class AutoSortApp(App):
         self.fo.set_current_transaction(tid)
         self.fo.invalidate_cache()
 
-        def cb(current, total, name):
-            self.call_from_thread(
-                log.write, f"  [{current}/{total}] {name}"
-            )
-
-        self.fo.set_progress_callback(cb)
+        self.fo.set_progress_callback(self._make_progress_callback(log))
         result = self.fo.organize_directory(source, dry_run=False)
 
         if result.files_moved > 0:
@@ -218,12 +238,7 @@ class AutoSortApp(App):
         self.fo.set_current_transaction(tid)
         self.fo.invalidate_cache()
 
-        def cb(current, total, name):
-            self.call_from_thread(
-                log.write, f"  [{current}/{total}] {name}"
-            )
-
-        self.fo.set_progress_callback(cb)
+        self.fo.set_progress_callback(self._make_progress_callback(log))
         result = self.fo.resort_directory(source, dry_run=False)
 
         if result.files_moved > 0:
@@ -2,33 +2,27 @@
 
 from __future__ import annotations
 
-import logging
-import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from autosort import __version__
-from autosort.console import (
-    console,
-    notify_category_counts,
-    print_categories,
-    print_error,
-    print_file_list,
-    print_info,
-    print_results,
-    print_success,
-    print_undo_history,
-    print_welcome,
-    progress_bar,
-)
-from autosort.core.config import ConfigManager
-from autosort.core.organizer import FileOrganizer
-from autosort.core.paths import PathManager
-from autosort.services.undo import UndoManager
+
+if TYPE_CHECKING:
+    from autosort.core.paths import PathManager
+
+# rich and the core modules are imported inside the commands that need
+# them so that --help/--version (and the click dispatch itself) stay off
+# the heavy import path.
 
 
 def _boot():
+    from autosort.core.config import ConfigManager
+    from autosort.core.organizer import FileOrganizer
+    from autosort.core.paths import PathManager
+    from autosort.services.undo import UndoManager
+
     cm = ConfigManager()
     cm.load_config()
     pm = PathManager()
@@ -78,6 +72,15 @@ def tui():
 @click.option("--quiet", is_flag=True, help="Suppress notifications")
 def run(path, desktop, downloads, dry_run, quiet):
     """Sort files in a directory."""
+    from autosort.console import (
+        console,
+        notify_category_counts,
+        print_error,
+        print_file_list,
+        print_results,
+        progress_bar,
+    )
+
     cm, pm, um, fo = _boot()
     target = _resolve_path(path, desktop, downloads, pm)
     if target is None:
@@ -135,6 +138,15 @@ def resort(path, desktop, downloads, dry_run, quiet):
     destination has changed (e.g. after editing config or updating rules).
     Files already in the right place are left untouched.
     """
+    from autosort.console import (
+        console,
+        notify_category_counts,
+        print_error,
+        print_file_list,
+        print_results,
+        progress_bar,
+    )
+
     cm, pm, um, fo = _boot()
     target = _resolve_path(path, desktop, downloads, pm)
     if target is None:
@@ -189,6 +201,7 @@ def resort(path, desktop, downloads, dry_run, quiet):
 @click.option("--quiet", is_flag=True, help="Suppress notifications")
 def watch(paths, desktop, downloads, quiet):
     """Watch directories and auto-sort new files."""
+    from autosort.console import console, notify_category_counts
     from autosort.core.watcher import DirectoryWatcher
     from autosort.services.notify import notify_sort_complete
 
@@ -237,6 +250,14 @@ def watch(paths, desktop, downloads, quiet):
 @click.option("--list", "show_list", is_flag=True, help="Show undo history")
 def undo(show_list):
     """Undo the last file organization."""
+    from autosort.console import (
+        console,
+        print_error,
+        print_info,
+        print_success,
+        print_undo_history,
+    )
+
     cm, pm, um, fo = _boot()
 
     if show_list:
@@ -264,10 +285,18 @@ def config():
     pass
 
 
+def _config_manager():
+    from autosort.core.config import ConfigManager
+
+    return ConfigManager()
+
+
 @config.command()
 def show():
     """Display current configuration."""
-    cm = ConfigManager()
+    from autosort.console import print_categories
+
+    cm = _config_manager()
     cm.load_config()
     print_categories(cm.get_config())
 
@@ -275,7 +304,9 @@ def show():
 @config.command()
 def reset():
     """Reset configuration to defaults."""
-    cm = ConfigManager()
+    from autosort.console import print_success
+
+    cm = _config_manager()
     cm.load_config()
     if click.confirm("Reset to default configuration?"):
         cm.reset_to_defaults()
@@ -287,7 +318,7 @@ def edit():
     """Open configuration in $EDITOR."""
     import os
     import subprocess
-    cm = ConfigManager()
+    cm = _config_manager()
     cm.load_config()
     editor = os.environ.get("EDITOR", "nano")
     subprocess.run([editor, str(cm.config_path)])
@@ -296,7 +327,7 @@ def edit():
 @config.command("path")
 def config_path():
     """Print configuration file path."""
-    cm = ConfigManager()
+    cm = _config_manager()
     click.echo(cm.config_path)
 
 
@@ -306,6 +337,8 @@ def config_path():
 @click.option("--downloads", is_flag=True, help="Watch ~/Downloads")
 def install(paths, desktop, downloads):
     """Install LaunchAgent for auto-sorting on login."""
+    from autosort.console import print_info, print_success
+    from autosort.core.paths import PathManager
     from autosort.services import launchd
 
     pm = PathManager()
@@ -327,6 +360,7 @@ def install(paths, desktop, downloads):
 @cli.command()
 def uninstall():
     """Remove the AutoSort LaunchAgent."""
+    from autosort.console import print_info, print_success
     from autosort.services import launchd
 
     if launchd.uninstall():
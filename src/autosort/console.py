@@ -104,13 +104,16 @@ def print_results(result, dry_run: bool = False) -> None:
 
 
 def print_file_list(operations, target_root) -> None:
+    lines = []
     for op in operations:
         if op.destination:
             try:
                 rel = op.destination.relative_to(target_root)
-                console.print(f"  [dim]{op.source.name}[/dim] -> [cyan]{rel.parent}/[/cyan]")
+                lines.append(f"  [dim]{op.source.name}[/dim] -> [cyan]{rel.parent}/[/cyan]")
             except ValueError:
-                console.print(f"  [dim]{op.source.name}[/dim] -> [cyan]{op.destination.parent}/[/cyan]")
+                lines.append(f"  [dim]{op.source.name}[/dim] -> [cyan]{op.destination.parent}/[/cyan]")
+    if lines:
+        console.print("\n".join(lines))
 
 
 def print_undo_history(history: List[Dict[str, Any]]) -> None:
@@ -170,13 +173,12 @@ def print_info(msg: str) -> None:
     console.print(f"[blue]{msg}[/blue]")
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def _fmt_size(size_bytes: int) -> str:
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = 0
-    s = float(size_bytes)
-    while s >= 1024 and i < len(units) - 1:
-        s /= 1024.0
-        i += 1
-    return f"{s:.1f} {units[i]}"
+    # bit_length picks the unit directly; one division instead of a loop.
+    i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
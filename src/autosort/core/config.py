@@ -6,10 +6,10 @@ import copy
 import json
 import logging
 import shutil
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from itertools import zip_longest
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -31,14 +31,12 @@ def _load_bundled_defaults() -> Dict[str, Any]:
 
 def _compare_versions(a: str, b: str) -> int:
     """Return 1 if a>b, -1 if a<b, 0 if equal."""
-    va = [int(p) for p in a.split(".") if p.isdigit()]
-    vb = [int(p) for p in b.split(".") if p.isdigit()]
-    for x, y in zip_longest(va, vb, fillvalue=0):
-        if x > y:
-            return 1
-        if x < y:
-            return -1
-    return 0
+    va = tuple(int(p) for p in a.split(".") if p.isdigit())
+    vb = tuple(int(p) for p in b.split(".") if p.isdigit())
+    n = max(len(va), len(vb))
+    va += (0,) * (n - len(va))
+    vb += (0,) * (n - len(vb))
+    return (va > vb) - (va < vb)
 
 
 class ConfigStatus(Enum):
@@ -271,6 +269,13 @@ class ConfigManager:
         self.status = ConfigStatus.ERROR
         self.error_message = ""
         self._defaults = _load_bundled_defaults()
+        # Frozen once so update_with_defaults never rebuilds the default
+        # extension sets when diffing against a user config.
+        self._default_ext_sets: Dict[str, frozenset] = {
+            name: frozenset(cat.get("extensions", []))
+            for name, cat in self._defaults.get("categories", {}).items()
+            if isinstance(cat, dict)
+        }
         self._migrator = ConfigMigrator()
 
     def load_config(self) -> bool:
@@ -321,7 +326,7 @@ class ConfigManager:
                 json.dump(self.config, f, indent=2, ensure_ascii=False)
             return True
         except Exception as e:
-            logger.error(f"Error saving config: {e}")
+            logger.error("Error saving config: %s", e)
             return False
 
     def get_categories(self) -> Dict[str, Category]:
@@ -338,11 +343,13 @@ class ConfigManager:
         return cats
 
     def get_extension_mapping(self) -> Dict[str, str]:
+        # Interned keys keep their hash cached, so the per-file dict.get
+        # in the organizer hot loop never re-hashes the extension string.
         ext_map: Dict[str, str] = {}
         for _name, data in self.config.get("categories", {}).items():
             folder = data.get("folder_name", _name)
             for ext in data.get("extensions", []):
-                ext_map[ext.lower()] = folder
+                ext_map[sys.intern(ext.lower())] = folder
         return ext_map
 
     def add_category(self, name: str, extensions: List[str], folder_name: str) -> bool:
@@ -403,14 +410,18 @@ class ConfigManager:
             if cat_name not in updated.get("categories", {}):
                 updated.setdefault("categories", {})[cat_name] = copy.deepcopy(default_cat)
             else:
-                cur_exts = set(updated["categories"][cat_name].get("extensions", []))
-                def_exts = set(default_cat.get("extensions", []))
-                updated["categories"][cat_name]["extensions"] = sorted(cur_exts | def_exts)
-                updated["categories"][cat_name].setdefault("folder_name", default_cat.get("folder_name", cat_name))
+                cur = updated["categories"][cat_name]
+                def_exts = self._default_ext_sets.get(cat_name, frozenset())
+                cur_exts = set(cur.get("extensions", []))
+                # Common case: the user config already carries every default
+                # extension -- skip the union/sort/replace churn entirely.
+                if not def_exts.issubset(cur_exts):
+                    cur["extensions"] = sorted(cur_exts | def_exts)
+                cur.setdefault("folder_name", default_cat.get("folder_name", cat_name))
                 def_rules = default_cat.get("rules")
                 if isinstance(def_rules, list) and def_rules:
-                    if not updated["categories"][cat_name].get("rules"):
-                        updated["categories"][cat_name]["rules"] = copy.deepcopy(def_rules)
+                    if not cur.get("rules"):
+                        cur["rules"] = copy.deepcopy(def_rules)
         updated.setdefault("metadata", {})["version"] = self._defaults.get("metadata", {}).get("version", "3.1")
         return updated
 
@@ -438,7 +449,7 @@ class ConfigManager:
             try:
                 return self._migrator.migrate(config, cur, target)
             except Exception as e:
-                logger.error(f"Migration failed: {e}")
+                logger.error("Migration failed: %s", e)
                 if backup:
                     self._restore(backup)
                 return config
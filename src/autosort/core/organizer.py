@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
+import errno
 import fnmatch
 import logging
 import os
 import re
-import shutil
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from autosort.core.config import Category, MatchCondition, SortRule
 
@@ -59,12 +62,17 @@ class OrganizationResult:
 
 
 class _FileSignals:
-    """Per-file cached stat and EXIF for rule evaluation."""
+    """Per-file cached name forms, stat, and EXIF for rule evaluation."""
 
-    __slots__ = ("_path", "_stat", "_exif", "_stat_err", "_exif_done")
+    __slots__ = ("_path", "name", "name_lower", "ext_lower", "_stat", "_exif", "_stat_err", "_exif_done")
 
     def __init__(self, path: Path):
         self._path = path
+        # Lowered once here; conditions on the same file reuse these
+        # instead of re-lowercasing per condition.
+        self.name = path.name
+        self.name_lower = self.name.lower()
+        self.ext_lower = _name_suffix(self.name_lower)
         self._stat: Optional[os.stat_result] = None
         self._stat_err: Optional[Exception] = None
         self._exif: Dict[str, Any] = {}
@@ -88,12 +96,34 @@ class _FileSignals:
         return self._exif
 
 
+_PIL_IMAGE: Optional[Any] = None
+_PIL_CHECKED = False
+
+
+def _pil_image_module() -> Optional[Any]:
+    """PIL.Image, imported on first use and cached (None when unavailable).
+
+    Kept lazy so organizer imports stay fast for runs that never touch
+    EXIF rules, while repeat callers skip the import machinery.
+    """
+    global _PIL_IMAGE, _PIL_CHECKED
+    if not _PIL_CHECKED:
+        _PIL_CHECKED = True
+        try:
+            import PIL.Image
+            _PIL_IMAGE = PIL.Image
+        except ImportError:
+            _PIL_IMAGE = None
+    return _PIL_IMAGE
+
+
 def _read_exif(file_path: Path) -> Dict[str, Any]:
     meta: Dict[str, Any] = {"software_used": None, "camera_info": None}
+    pil = _pil_image_module()
+    if pil is None:
+        return meta
     try:
-        import PIL.Image
-
-        with PIL.Image.open(file_path) as img:
+        with pil.open(file_path) as img:
             exif = img.getexif()
             if exif:
                 meta["software_used"] = exif.get(305)
@@ -101,8 +131,6 @@ def _read_exif(file_path: Path) -> Dict[str, Any]:
                 model = exif.get(272)
                 if make or model:
                     meta["camera_info"] = f"{make or ''} {model or ''}".strip()
-    except ImportError:
-        pass
     except Exception:
         pass
     return meta
@@ -126,8 +154,8 @@ _EXIF_IMAGE_SUFFIXES = frozenset(
 )
 
 
-def _exif_combined_string(file_path: Path, sig: _FileSignals) -> str:
-    if file_path.suffix.lower() not in _EXIF_IMAGE_SUFFIXES:
+def _exif_combined_string(sig: _FileSignals) -> str:
+    if sig.ext_lower not in _EXIF_IMAGE_SUFFIXES:
         return ""
     m = sig.exif()
     sw = m.get("software_used") or ""
@@ -135,24 +163,39 @@ def _exif_combined_string(file_path: Path, sig: _FileSignals) -> str:
     return f"{sw} {cam}".lower()
 
 
+_SCREENSHOT_SOFTWARE_RE = re.compile(
+    "|".join(
+        re.escape(k)
+        for k in (
+            "screenshot",
+            "screen shot",
+            "snipping",
+            "snagit",
+            "cleanshot",
+            "shottr",
+            "gyazo",
+            "lightshot",
+            "skitch",
+            "screencapture",
+            "kap",
+        )
+    ),
+    re.IGNORECASE,
+)
+
+
 def _looks_like_screenshot_software(sw: str) -> bool:
     if not sw:
         return False
-    s = str(sw).lower()
-    keys = (
-        "screenshot",
-        "screen shot",
-        "snipping",
-        "snagit",
-        "cleanshot",
-        "shottr",
-        "gyazo",
-        "lightshot",
-        "skitch",
-        "screencapture",
-        "kap",
-    )
-    return any(k in s for k in keys)
+    return _SCREENSHOT_SOFTWARE_RE.search(str(sw)) is not None
+
+
+def _name_suffix(name: str) -> str:
+    """Extension of ``name`` including the dot (pathlib semantics, no Path machinery)."""
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i:]
+    return ""
 
 
 def _parse_iso_date(s: str) -> Optional[float]:
@@ -170,14 +213,25 @@ def _parse_iso_date(s: str) -> Optional[float]:
         return None
 
 
-def _check_condition(
-    file_path: Path,
-    cond: MatchCondition,
-    sig: _FileSignals,
-) -> bool:
+@lru_cache(maxsize=256)
+def _compiled_glob(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Union of lowercased glob patterns, compiled once per distinct rule."""
+    return re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in patterns))
+
+
+@lru_cache(maxsize=256)
+def _compiled_regex(pattern: str) -> Optional[re.Pattern]:
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        logger.debug("Invalid regex in rule: %s", pattern)
+        return None
+
+
+def _check_condition(cond: MatchCondition, sig: _FileSignals) -> bool:
     ct = cond.type
-    ext = file_path.suffix.lower()
-    name = file_path.name
+    ext = sig.ext_lower
+    name = sig.name
 
     if ct == "extension":
         vals = cond.values or ([] if cond.value is None else [cond.value])
@@ -186,24 +240,20 @@ def _check_condition(
 
     if ct == "glob":
         vals = cond.values or ([] if cond.value is None else [cond.value])
-        nl = name.lower()
-        for pat in vals:
-            if fnmatch.fnmatch(nl, str(pat).lower()):
-                return True
-        return False
+        if not vals:
+            return False
+        matcher = _compiled_glob(tuple(str(p).lower() for p in vals))
+        return matcher.match(sig.name_lower) is not None
 
     if ct == "regex":
         pat = cond.value if cond.value is not None else (cond.values[0] if cond.values else None)
         if not pat:
             return False
-        try:
-            return re.search(str(pat), name, re.IGNORECASE) is not None
-        except re.error:
-            logger.debug("Invalid regex in rule: %s", pat)
-            return False
+        rx = _compiled_regex(str(pat))
+        return rx is not None and rx.search(name) is not None
 
     if ct == "exif_contains":
-        combined = _exif_combined_string(file_path, sig)
+        combined = _exif_combined_string(sig)
         if not combined:
             return False
         for v in cond.values or ([] if cond.value is None else [cond.value]):
@@ -212,13 +262,13 @@ def _check_condition(
         return False
 
     if ct == "exif_camera":
-        if file_path.suffix.lower() not in _EXIF_IMAGE_SUFFIXES:
+        if sig.ext_lower not in _EXIF_IMAGE_SUFFIXES:
             return False
         cam = (sig.exif().get("camera_info") or "").strip()
         return bool(cam)
 
     if ct == "exif_screenshot_like":
-        if file_path.suffix.lower() not in _EXIF_IMAGE_SUFFIXES:
+        if sig.ext_lower not in _EXIF_IMAGE_SUFFIXES:
             return False
         sw = sig.exif().get("software_used") or ""
         return _looks_like_screenshot_software(str(sw))
@@ -264,13 +314,13 @@ def _check_condition(
     return False
 
 
-def _rule_matches(file_path: Path, rule: SortRule, sig: _FileSignals) -> bool:
+def _rule_matches(rule: SortRule, sig: _FileSignals) -> bool:
     if not rule.conditions:
         return False
     mode = rule.match_mode if rule.match_mode in ("all", "any") else "all"
     if mode == "all":
-        return all(_check_condition(file_path, c, sig) for c in rule.conditions)
-    return any(_check_condition(file_path, c, sig) for c in rule.conditions)
+        return all(_check_condition(c, sig) for c in rule.conditions)
+    return any(_check_condition(c, sig) for c in rule.conditions)
 
 
 def _evaluate_rules_for_category(file_path: Path, cat: Category) -> Tuple[str, str]:
@@ -279,7 +329,7 @@ def _evaluate_rules_for_category(file_path: Path, cat: Category) -> Tuple[str, s
         return "", ""
     sig = _FileSignals(file_path)
     for rule in cat.rules:
-        if _rule_matches(file_path, rule, sig):
+        if _rule_matches(rule, sig):
             return rule.folder.strip("/").replace("\\", "/"), rule.name
     return "", ""
 
@@ -292,15 +342,29 @@ class FileOrganizer:
         self.path_manager = path_manager
         self.undo_manager = undo_manager
         self.ignore_patterns: List[str] = []
+        self._ignore_literals: frozenset[str] = frozenset()
+        self._ignore_regex: Optional[re.Pattern[str]] = None
+        self._ignore_file_state: Optional[Tuple[Path, int, int]] = None
         self.progress_callback: Optional[Callable[[int, int, str], None]] = None
         self.current_transaction_id: Optional[str] = None
+        self._cancel = threading.Event()
         self._extension_map: Optional[Dict[str, str]] = None
+        self._multidot_exts: Optional[Tuple[str, ...]] = None
         self._categories_cache = None
+        self._folder_index: Optional[Dict[str, Category]] = None
+        self._ext_cache: Dict[str, Tuple[str, Optional[Category]]] = {}
+        self._ensured_dirs: set[Path] = set()
+        self._unique_counters: Dict[Tuple[Path, str, str], int] = {}
+        self._dir_names: Dict[Path, set[str]] = {}
+        self._dest_dir_cache: Dict[Tuple[str, str], Path] = {}
 
     def invalidate_cache(self):
         """Clear cached lookups (call after config changes)."""
         self._extension_map = None
+        self._multidot_exts = None
         self._categories_cache = None
+        self._folder_index = None
+        self._ext_cache.clear()
 
     @property
     def extension_map(self) -> Dict[str, str]:
@@ -314,6 +378,14 @@ class FileOrganizer:
             self._categories_cache = self.config_manager.get_categories()
         return self._categories_cache
 
+    def request_cancel(self) -> None:
+        """Ask a running organize/resort pass to stop after the current file.
+
+        Safe to call from another thread; the flag is re-armed when the
+        next pass starts.
+        """
+        self._cancel.set()
+
     def set_progress_callback(self, callback: Callable[[int, int, str], None]) -> None:
         self.progress_callback = callback
 
@@ -324,24 +396,45 @@ class FileOrganizer:
         if self.undo_manager and self.current_transaction_id:
             self.undo_manager.add_operation(self.current_transaction_id, operation)
 
+    _IGNORE_LINE_RE = re.compile(r"(?m)^[ \t]*([^#\s][^\n]*?)[ \t]*$")
+
     def load_ignore_patterns(self, ignore_file: Path) -> bool:
         try:
-            if not ignore_file.exists():
+            try:
+                st = ignore_file.stat()
+            except FileNotFoundError:
+                return True
+            # Watch mode and the TUI reload the same .sortignore before
+            # every pass; skip the re-parse while the file is unchanged.
+            state = (ignore_file, st.st_mtime_ns, st.st_size)
+            if state == self._ignore_file_state:
                 return True
-            with open(ignore_file, "r", encoding="utf-8") as f:
-                self.ignore_patterns = [
-                    line.strip()
-                    for line in f
-                    if line.strip() and not line.strip().startswith("#")
-                ]
+            # One C-level regex pass instead of per-line strip/startswith.
+            self.ignore_patterns = self._IGNORE_LINE_RE.findall(
+                ignore_file.read_text(encoding="utf-8")
+            )
+            self._compile_ignore_patterns()
+            self._ignore_file_state = state
             return True
         except Exception as e:
-            logger.error(f"Error loading ignore patterns: {e}")
+            logger.error("Error loading ignore patterns: %s", e)
             return False
 
+    def _compile_ignore_patterns(self) -> None:
+        """Split patterns into literal names (set lookup) and a unioned regex."""
+        literals = [p for p in self.ignore_patterns if not any(c in p for c in "*?[")]
+        globs = [p for p in self.ignore_patterns if any(c in p for c in "*?[")]
+        self._ignore_literals = frozenset(literals)
+        self._ignore_regex = (
+            re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs))
+            if globs
+            else None
+        )
+
     def organize_directory(
         self, source_path: Path, dry_run: bool = False
     ) -> OrganizationResult:
+        self._cancel.clear()
         path_info = self.path_manager.validate_path(source_path)
         if not path_info.exists or not path_info.is_directory:
             return OrganizationResult(
@@ -375,6 +468,7 @@ class FileOrganizer:
         against the current rules, and moves only those whose correct
         destination differs from their current location.
         """
+        self._cancel.clear()
         autosort_root = self.path_manager.get_target_path(source_path)
         if not autosort_root.is_dir():
             return OrganizationResult(
@@ -399,12 +493,15 @@ class FileOrganizer:
 
     def analyze_files(self, source_path: Path) -> Dict[str, Any]:
         try:
-            files = self._scan_files(source_path)
+            total_files = 0
             category_stats: Dict[str, Any] = {}
             total_size = 0
-            for fp in files:
-                category_folder, rule_folder, rule_name = self._categorize_file(fp)
-                size = fp.stat().st_size
+            for entry in self._iter_entries(source_path):
+                total_files += 1
+                category_folder, rule_folder, rule_name = self._categorize_file(Path(entry.path))
+                # DirEntry caches the stat from the is_file() check, so this
+                # costs no extra syscall.
+                size = entry.stat(follow_symlinks=False).st_size
                 if category_folder not in category_stats:
                     category_stats[category_folder] = {
                         "count": 0,
@@ -421,27 +518,42 @@ class FileOrganizer:
                         subs[sub_key] = {"count": 0, "size": 0, "rule_name": rule_name}
                     subs[sub_key]["count"] += 1
                     subs[sub_key]["size"] += size
-            return {"total_files": len(files), "total_size": total_size, "categories": category_stats}
+            return {"total_files": total_files, "total_size": total_size, "categories": category_stats}
         except Exception as e:
-            logger.error(f"Error analyzing files: {e}")
+            logger.error("Error analyzing files: %s", e)
             return {"total_files": 0, "total_size": 0, "categories": {}, "error": str(e)}
 
     # -- internal helpers --
 
-    def _scan_files(self, source_path: Path) -> List[Path]:
-        result = []
+    def _iter_entries(self, source_path: Path) -> Iterator[os.DirEntry]:
+        """Yield sortable directory entries from ``source_path`` (non-recursive)."""
+        target_name = self.path_manager.get_target_path(source_path).name
         try:
-            for item in source_path.iterdir():
-                if not item.is_file():
-                    continue
-                if self._should_skip_file(item):
-                    continue
-                if self._should_ignore_file(item):
-                    continue
-                result.append(item)
+            with os.scandir(source_path) as it:
+                for entry in it:
+                    # Name checks are pure string work -- run them before the
+                    # d_type lookup so junk entries cost no type check at all.
+                    if entry.name == target_name:
+                        continue
+                    if self._should_skip_file(entry.name):
+                        continue
+                    if self._should_ignore_file(entry.name):
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    yield entry
         except Exception as e:
-            logger.error(f"Error scanning directory: {e}")
-        return result
+            logger.error("Error scanning directory: %s", e)
+
+    def _iter_files(self, source_path: Path) -> Iterator[Path]:
+        """Yield sortable files from ``source_path`` (non-recursive)."""
+        for entry in self._iter_entries(source_path):
+            yield Path(entry.path)
+
+    def _scan_files(self, source_path: Path) -> List[Path]:
+        # Materialized because progress reporting and result stats need the
+        # total count up front; streaming consumers can use _iter_files.
+        return list(self._iter_files(source_path))
 
     def _scan_files_recursive(self, root: Path) -> List[Path]:
         result = []
@@ -449,44 +561,87 @@ class FileOrganizer:
             for item in root.rglob("*"):
                 if not item.is_file():
                     continue
-                if self._should_skip_file(item):
+                if self._should_skip_file(item.name):
                     continue
-                if self._should_ignore_file(item):
+                if self._should_ignore_file(item.name):
                     continue
                 result.append(item)
         except Exception as e:
-            logger.error(f"Error scanning directory tree: {e}")
+            logger.error("Error scanning directory tree: %s", e)
         return result
 
     _ALWAYS_SKIP = frozenset({
-        ".DS_Store", "Thumbs.db", "desktop.ini", ".sortignore",
+        "Thumbs.db", "desktop.ini",
     })
 
-    def _should_skip_file(self, file_path: Path) -> bool:
-        return file_path.name in self._ALWAYS_SKIP
+    def _should_skip_file(self, name: str) -> bool:
+        # Hidden files (.DS_Store, .localized, .sortignore, ...) are invisible
+        # in Finder and often carry app state; never sort them.
+        return name.startswith(".") or name in self._ALWAYS_SKIP
 
-    def _should_ignore_file(self, file_path: Path) -> bool:
-        return any(fnmatch.fnmatch(file_path.name, p) for p in self.ignore_patterns)
+    def _should_ignore_file(self, name: str) -> bool:
+        if name in self._ignore_literals:
+            return True
+        return self._ignore_regex is not None and self._ignore_regex.match(name) is not None
 
     def _resolve_category_config(self, category_folder_name: str) -> Optional[Category]:
-        for _key, cat in self.categories.items():
-            if cat.folder_name == category_folder_name:
-                return cat
-        return None
+        if self._folder_index is None:
+            self._folder_index = {cat.folder_name: cat for cat in self.categories.values()}
+        return self._folder_index.get(category_folder_name)
+
+    def _effective_suffix(self, name: str) -> str:
+        """Suffix used for categorization, honouring multi-dot extensions.
+
+        Configured extensions like ``.tar.gz`` span more than one suffix
+        component, so a plain ``rfind('.')`` slice would see only ``.gz``
+        and misclassify them. Match the (few) multi-dot extensions from
+        the config longest-first before falling back to the last suffix.
+        """
+        if self._multidot_exts is None:
+            self._multidot_exts = tuple(
+                sorted(
+                    (e for e in self.extension_map if e.count(".") > 1),
+                    key=len,
+                    reverse=True,
+                )
+            )
+        if self._multidot_exts:
+            lower = name.lower()
+            for ext in self._multidot_exts:
+                if lower.endswith(ext) and len(lower) > len(ext):
+                    return ext
+        return _name_suffix(name)
 
     def _categorize_file(self, file_path: Path) -> Tuple[str, str, str]:
-        ext = file_path.suffix.lower()
-        category_folder = self.extension_map.get(ext, "Miscellaneous")
-        cat = self._resolve_category_config(category_folder)
+        suffix = self._effective_suffix(file_path.name)
+        cached = self._ext_cache.get(suffix)
+        if cached is None:
+            category_folder = self.extension_map.get(suffix.lower(), "Miscellaneous")
+            cached = (category_folder, self._resolve_category_config(category_folder))
+            self._ext_cache[suffix] = cached
+        category_folder, cat = cached
         if not cat:
             return category_folder, "", ""
         rule_folder, rule_name = _evaluate_rules_for_category(file_path, cat)
         return category_folder, rule_folder, rule_name
 
+    def _ensure_directory_cached(self, dest_dir: Path) -> bool:
+        """Create ``dest_dir`` at most once per run (the set is cleared per pass)."""
+        if dest_dir in self._ensured_dirs:
+            return True
+        if not self.path_manager.ensure_directory(dest_dir):
+            return False
+        self._ensured_dirs.add(dest_dir)
+        return True
+
     def _destination_dir(self, target_path: Path, category_folder: str, rule_folder: str) -> Path:
-        dest = target_path / category_folder
-        if rule_folder:
-            dest = dest.joinpath(*Path(rule_folder).parts)
+        key = (category_folder, rule_folder)
+        dest = self._dest_dir_cache.get(key)
+        if dest is None:
+            dest = target_path / category_folder
+            if rule_folder:
+                dest = dest.joinpath(*Path(rule_folder).parts)
+            self._dest_dir_cache[key] = dest
         return dest
 
     def _process_files(
@@ -496,41 +651,80 @@ class FileOrganizer:
         error_log: List[str] = []
         files_moved = 0
         errors = 0
-
+        self._ensured_dirs.clear()
+        self._unique_counters.clear()
+        self._dest_dir_cache.clear()
+        self._dir_names.clear()
+
+        # Plan serially (categorize, create dirs, reserve unique names), then
+        # execute the moves in parallel -- rename releases the GIL, so a small
+        # pool overlaps syscall latency on slow or network-backed volumes.
+        plan: List[FileOperation] = []
+        total = len(files)
+        progress = self.progress_callback
+        categorize = self._categorize_file
+        destination_dir = self._destination_dir
         for i, fp in enumerate(files):
+            if self._cancel.is_set():
+                break
             try:
-                if self.progress_callback:
-                    self.progress_callback(i + 1, len(files), fp.name)
-                category_folder, rule_folder, rule_name = self._categorize_file(fp)
-                dest_dir = self._destination_dir(target_path, category_folder, rule_folder)
-                if not dry_run and not self.path_manager.ensure_directory(dest_dir):
+                if progress:
+                    progress(i + 1, total, fp.name)
+                category_folder, rule_folder, rule_name = categorize(fp)
+                dest_dir = destination_dir(target_path, category_folder, rule_folder)
+                if not dry_run and not self._ensure_directory_cached(dest_dir):
                     error_log.append(f"Failed to create directory: {dest_dir}")
                     errors += 1
                     continue
                 dest_file = self._get_unique_path(dest_dir / fp.name)
-                op = FileOperation(
-                    operation_type=OperationType.MOVE,
-                    source=fp,
-                    destination=dest_file,
-                    metadata={
-                        "category_folder": category_folder,
-                        "rule_folder": rule_folder,
-                        "rule_name": rule_name,
-                    },
+                plan.append(
+                    FileOperation(
+                        operation_type=OperationType.MOVE,
+                        source=fp,
+                        destination=dest_file,
+                        metadata={
+                            "category_folder": category_folder,
+                            "rule_folder": rule_folder,
+                            "rule_name": rule_name,
+                        },
+                    )
                 )
-                if dry_run:
-                    operations.append(op)
-                else:
-                    if self._safe_move_file(fp, dest_file):
+            except Exception as e:
+                error_log.append(f"Error processing {fp.name}: {type(e).__name__}: {e}")
+                errors += 1
+
+        if dry_run:
+            operations = plan
+        elif len(plan) == 1:
+            op = plan[0]
+            if self._safe_move_file(op.source, op.destination):
+                operations.append(op)
+                self._add_operation_to_transaction(op)
+                files_moved += 1
+            else:
+                error_log.append(f"Failed to move: {op.source.name}")
+                errors += 1
+        elif plan:
+            workers = min(8, (os.cpu_count() or 2) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._safe_move_file, op.source, op.destination): op
+                    for op in plan
+                }
+                for future in as_completed(futures):
+                    if self._cancel.is_set():
+                        for pending in futures:
+                            pending.cancel()
+                    if future.cancelled():
+                        continue
+                    op = futures[future]
+                    if future.result():
                         operations.append(op)
                         self._add_operation_to_transaction(op)
                         files_moved += 1
                     else:
-                        error_log.append(f"Failed to move: {fp.name}")
+                        error_log.append(f"Failed to move: {op.source.name}")
                         errors += 1
-            except Exception as e:
-                error_log.append(f"Error processing {fp.name}: {e}")
-                errors += 1
 
         return OrganizationResult(
             success=errors == 0,
@@ -548,8 +742,14 @@ class FileOrganizer:
         error_log: List[str] = []
         files_moved = 0
         errors = 0
+        self._ensured_dirs.clear()
+        self._unique_counters.clear()
+        self._dest_dir_cache.clear()
+        self._dir_names.clear()
 
         for i, fp in enumerate(files):
+            if self._cancel.is_set():
+                break
             try:
                 if self.progress_callback:
                     self.progress_callback(i + 1, len(files), fp.name)
@@ -574,7 +774,7 @@ class FileOrganizer:
                 if dry_run:
                     operations.append(op)
                 else:
-                    if not self.path_manager.ensure_directory(dest_dir):
+                    if not self._ensure_directory_cached(dest_dir):
                         error_log.append(f"Failed to create directory: {dest_dir}")
                         errors += 1
                         continue
@@ -586,7 +786,7 @@ class FileOrganizer:
                         error_log.append(f"Failed to move: {fp.name}")
                         errors += 1
             except Exception as e:
-                error_log.append(f"Error processing {fp.name}: {e}")
+                error_log.append(f"Error processing {fp.name}: {type(e).__name__}: {e}")
                 errors += 1
 
         if not dry_run:
@@ -618,24 +818,56 @@ class FileOrganizer:
                 except OSError:
                     pass
 
+    def _reserved_names(self, parent: Path) -> set:
+        """Names already present (or planned) in ``parent``, listed once per run."""
+        names = self._dir_names.get(parent)
+        if names is None:
+            try:
+                names = set(os.listdir(parent))
+            except OSError:
+                names = set()
+            self._dir_names[parent] = names
+        return names
+
     def _get_unique_path(self, dest: Path) -> Path:
-        if not dest.exists():
+        # Uniqueness is decided against an in-memory reservation set (one
+        # listdir per destination dir per run) instead of an exists() stat
+        # per candidate -- which also keeps planned-but-unmoved names from
+        # colliding with each other.
+        parent = dest.parent
+        names = self._reserved_names(parent)
+        if dest.name not in names:
+            names.add(dest.name)
             return dest
-        stem, suffix, parent = dest.stem, dest.suffix, dest.parent
-        for i in range(1, 1001):
-            candidate = parent / f"{stem}_{i}{suffix}"
-            if not candidate.exists():
-                return candidate
-        return parent / f"{stem}_{int(time.time())}{suffix}"
+        stem, suffix = dest.stem, dest.suffix
+        key = (parent, stem, suffix)
+        start = self._unique_counters.get(key, 1)
+        for i in range(start, start + 1000):
+            candidate = f"{stem}_{i}{suffix}"
+            if candidate not in names:
+                self._unique_counters[key] = i + 1
+                names.add(candidate)
+                return parent / candidate
+        fallback = f"{stem}_{int(time.time())}{suffix}"
+        names.add(fallback)
+        return parent / fallback
 
     def _safe_move_file(self, source: Path, dest: Path) -> bool:
         try:
-            if not source.exists() or not source.is_file():
-                return False
-            if not os.access(source, os.R_OK) or not os.access(dest.parent, os.W_OK):
-                return False
-            shutil.move(str(source), str(dest))
+            os.replace(source, dest)
             return True
-        except Exception as e:
-            logger.error(f"Error moving {source} to {dest}: {e}")
+        except OSError as e:
+            if e.errno == errno.EXDEV:
+                # Cross-device: copy2 dispatches to fcopyfile/sendfile
+                # (kernel-side copy), then drop the original.
+                try:
+                    import shutil
+
+                    shutil.copy2(source, dest)
+                    os.unlink(source)
+                    return True
+                except Exception as e2:
+                    logger.error("Error moving %s to %s: %s", source, dest, e2)
+                    return False
+            logger.error("Error moving %s to %s: %s", source, dest, e)
             return False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 from dataclasses import dataclass
 from enum import Enum
@@ -11,6 +12,14 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Localized home-folder names keyed by LANG prefix. Probing the locale's
+# own candidate first makes the common case a single stat.
+_LOCALE_FOLDER_HINTS = {
+    "es": frozenset({"Escritorio", "Descargas"}),
+    "fr": frozenset({"Bureau", "Téléchargements"}),
+    "de": frozenset({"Schreibtisch"}),
+}
+
 
 class PathType(Enum):
     DESKTOP = "desktop"
@@ -94,7 +103,7 @@ class PathManager:
         except subprocess.TimeoutExpired:
             return None
         except Exception as e:
-            logger.error(f"Folder dialog error: {e}")
+            logger.error("Folder dialog error: %s", e)
             return None
 
     def get_target_path(self, source_path: Path) -> Path:
@@ -105,11 +114,16 @@ class PathManager:
             path.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            logger.error(f"Cannot create directory {path}: {e}")
+            logger.error("Cannot create directory %s: %s", path, e)
             return False
 
     def _detect_path(self, candidates: list[str]) -> Path:
         home = Path.home()
+        hints = _LOCALE_FOLDER_HINTS.get(os.environ.get("LANG", "")[:2])
+        if hints:
+            preferred = next((c for c in candidates if c in hints), None)
+            if preferred:
+                candidates = [preferred] + [c for c in candidates if c != preferred]
         for name in candidates:
             p = home / name
             if p.is_dir():
@@ -54,7 +54,7 @@ class _DebouncedHandler(FileSystemEventHandler):
             try:
                 self._callback(paths)
             except Exception as e:
-                logger.error(f"Watcher callback error: {e}")
+                logger.error("Watcher callback error: %s", e)
 
 
 class DirectoryWatcher:
@@ -75,7 +75,7 @@ class DirectoryWatcher:
         for p in self._paths:
             if p.is_dir():
                 self._observer.schedule(self._handler, str(p), recursive=False)
-                logger.info(f"Watching: {p}")
+                logger.info("Watching: %s", p)
         self._observer.start()
         self._running = True
 
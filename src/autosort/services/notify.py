@@ -23,7 +23,7 @@ def notify(title: str, message: str, sound: bool = False) -> None:
             timeout=5,
         )
     except Exception as e:
-        logger.debug(f"Notification failed: {e}")
+        logger.debug("Notification failed: %s", e)
 
 
 def notify_sort_complete(results: Dict[str, int], quiet: bool = False) -> None:
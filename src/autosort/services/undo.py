@@ -117,7 +117,7 @@ class UndoManager:
                 return self._undo_mkdir(op)
             return False
         except Exception as e:
-            logger.error(f"Undo failed: {e}")
+            logger.error("Undo failed: %s", e)
             return False
 
     def _undo_move(self, op: FileOperation) -> bool:
@@ -125,9 +125,9 @@ class UndoManager:
             return False
         if op.source.exists():
             target = self._unique(op.source)
-            shutil.move(str(op.destination), str(target))
+            shutil.move(op.destination, target)
         else:
-            shutil.move(str(op.destination), str(op.source))
+            shutil.move(op.destination, op.source)
         return True
 
     def _undo_mkdir(self, op: FileOperation) -> bool:
@@ -175,7 +175,7 @@ class UndoManager:
                     )
                 )
         except Exception as e:
-            logger.error(f"Error loading undo history: {e}")
+            logger.error("Error loading undo history: %s", e)
             self.transactions = []
 
     def _save(self):
@@ -210,4 +210,4 @@ class UndoManager:
             with open(self.undo_file, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
-            logger.error(f"Error saving undo history: {e}")
+            logger.error("Error saving undo history: %s", e)